@@ -10,6 +10,8 @@ JIRA = 'https://jira.coreos.com'
 SEARCH = f'{JIRA}/rest/api/2/search'
 BROWSE = f'{JIRA}/browse'
 DONE = '10001'
+FIELDS = 'issuetype,status,summary'
+MAX_RESULTS = 1000
 
 
 def main():
@@ -28,28 +30,34 @@ def main():
 def search(session, jql):
     return urllib.request.urlopen(urllib.request.Request(
         method='GET',
-        url=SEARCH + '?' + urllib.parse.urlencode({'jql': jql}),
+        url=SEARCH + '?' + urllib.parse.urlencode({
+            'jql': jql,
+            'fields': FIELDS,
+            'maxResults': MAX_RESULTS}),
         headers={
             'Content-Type': 'application/json',
             'Cookie': f'JSESSIONID={session}'}))
 
 
 def partition(l, pred):
-    ret = [], []
+    f, t = [], []
+    f_append, t_append = f.append, t.append
     for x in l:
-        ret[pred(x)].append(x)
-    return ret
+        (t_append if pred(x) else f_append)(x)
+    return f, t
 
 
 def print_issues(unf, fin):
-    fmt = f'<a href="{BROWSE}/{{key}}">{{key}}</a> {{fields[summary]}}<br />'
+    def fmt(x):
+        k = x['key']
+        return f'<a href="{BROWSE}/{k}">{k}</a> {x["fields"]["summary"]}<br />'
     key = lambda x: x['key']
-    print('Finished<br />')
-    for x in sorted(fin, key=key):
-        print(fmt.format(**x))
-    print('Unfinished<br />')
-    for x in sorted(unf, key=key):
-        print(fmt.format(**x))
+    sys.stdout.write('\n'.join((
+        'Finished<br />',
+        *map(fmt, sorted(fin, key=key)),
+        'Unfinished<br />',
+        *map(fmt, sorted(unf, key=key)),
+        '')))
 
 
 if __name__ == '__main__':